@@ -0,0 +1,134 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+from functools import lru_cache
+import math
+import random
+
+SIEVE_LIMIT = 1 << 16
+TRIAL_LIMIT = 1 << 12
+
+# Gaps between the numbers coprime to 2, 3 and 5, starting at 7
+WHEEL = (4, 2, 4, 2, 4, 6, 2, 6)
+
+@lru_cache(maxsize=None)
+def prime_sieve(limit):
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = b'\x00\x00'
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return sieve
+
+def is_prime(number):
+    if number <= SIEVE_LIMIT:
+        return number >= 0 and bool(prime_sieve(SIEVE_LIMIT)[number])
+
+    # Miller-Rabin with these bases is exact below 3.3e24
+    d = number - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        x = pow(base, d, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+def trial_division(number, limit):
+    factors = []
+    for prime in (2, 3, 5):
+        while number % prime == 0:
+            factors.append(prime)
+            number //= prime
+
+    candidate = 7
+    i = 0
+    while candidate <= limit and candidate * candidate <= number:
+        while number % candidate == 0:
+            factors.append(candidate)
+            number //= candidate
+        candidate += WHEEL[i]
+        i = (i + 1) % len(WHEEL)
+
+    return factors, number
+
+def pollard_rho(number):
+    # Brent's variant; seeded so runs are repeatable
+    rng = random.Random(number)
+    while True:
+        y = rng.randrange(1, number)
+        c = rng.randrange(1, number)
+        batch = 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % number
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % number
+                    q = q * abs(x - y) % number
+                g = math.gcd(q, number)
+                k += batch
+            r *= 2
+
+        if g == number:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % number
+                g = math.gcd(abs(x - ys), number)
+
+        if g != number:
+            return g
+
+def prime_factors(number):
+    factors, rest = trial_division(number, TRIAL_LIMIT)
+    yield from factors
+
+    pending = [rest] if rest > 1 else []
+    while pending:
+        composite = pending.pop()
+        if is_prime(composite):
+            yield composite
+        else:
+            divisor = pollard_rho(composite)
+            pending.append(divisor)
+            pending.append(composite // divisor)
+
+def factorize(number):
+    if number < 1:
+        return
+
+    divisors = [1]
+    for prime, exponent in Counter(prime_factors(number)).items():
+        divisors = [
+            divisor * prime ** power
+            for divisor in divisors
+            for power in range(exponent + 1)
+        ]
+
+    yield from sorted(divisors)
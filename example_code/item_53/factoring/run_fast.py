@@ -0,0 +1,48 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from factoring import factorize, prime_factors
+import time
+
+def slow_factorize(number):
+    for i in range(1, number + 1):
+        if number % i == 0:
+            yield i
+
+def main():
+    numbers = [2139079, 1214759, 1516637, 1852285]
+    for number in numbers:
+        assert list(factorize(number)) == list(slow_factorize(number))
+
+    for number in range(1, 2000):
+        assert list(factorize(number)) == list(slow_factorize(number))
+
+    for number in numbers:
+        start = time.perf_counter()
+        factors = list(factorize(number))
+        delta = time.perf_counter() - start
+        print(f'factorize({number}) took {delta * 1e6:.0f} '
+              f'microseconds: {factors}')
+
+    big = (2**61 - 1) * (2**31 - 1) * 1000003
+    start = time.perf_counter()
+    primes = sorted(prime_factors(big))
+    delta = time.perf_counter() - start
+    assert primes == [1000003, 2**31 - 1, 2**61 - 1]
+    print(f'prime_factors({big}) took {delta:.3f} seconds')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from service import FactorizeProcess, FactorizeService, DONE, TIMED_OUT
+from service import CANCELLED
+import time
+
+def slow_factorize(number):
+    for i in range(1, number + 1):
+        if number % i == 0:
+            yield i
+
+def main():
+    numbers = [2139079, 1214759, 1516637, 1852285]
+
+    start = time.time()
+    processes = []
+    for number in numbers:
+        process = FactorizeProcess(number, slow_factorize)
+        process.start()
+        processes.append(process)
+
+    for process in processes:
+        process.join()
+
+    end = time.time()
+    delta = end - start
+    print(f'Took {delta:.3f} seconds')
+
+    for process in processes:
+        assert process.status == DONE
+        assert process.factors == list(slow_factorize(process.number))
+
+    with FactorizeService(func=slow_factorize) as service:
+        for number in numbers:
+            service.submit(number, timeout=10)
+        runaway = service.submit(10**12, timeout=0.5)
+        cancelled = service.submit(10**12)
+
+        counts = {}
+        for job_id, number, factor in service.stream():
+            counts[job_id] = counts.get(job_id, 0) + 1
+            if job_id == cancelled and factor >= 2:
+                service.cancel(job_id)
+
+    for job_id, count in counts.items():
+        process = service.jobs[job_id]
+        print(f'Job {job_id} ({process.number}): {count} factors, '
+              f'{process.status}')
+    assert service.jobs[runaway].status == TIMED_OUT
+    assert service.jobs[cancelled].status == CANCELLED
+    for number, process in zip(numbers, service.jobs.values()):
+        assert process.status == DONE
+        assert process.factors == list(slow_factorize(number))
+
+    # Queued jobs hold no pipes, so big batches stay within fd limits
+    batch = range(10**6, 10**6 + 600)
+    with FactorizeService(max_workers=2) as service:
+        for number in batch:
+            service.submit(number)
+        for _ in service.stream():
+            pass
+    assert all(job.status == DONE for job in service.jobs.values())
+
+if __name__ == '__main__':
+    main()
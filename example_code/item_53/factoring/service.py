@@ -0,0 +1,175 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import factoring
+from collections import deque
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+import os
+import time
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+TIMED_OUT = 'timed out'
+
+class FactorizeProcess(Process):
+    def __init__(self, number, func=factoring.factorize):
+        super().__init__(daemon=True)
+        self.number = number
+        self.func = func
+        self.status = PENDING
+        self.factors = []
+        self.error = None
+        self.returncode = None
+        self.reader = self.writer = None  # Opened by start()
+
+    def run(self):
+        try:
+            for factor in self.func(self.number):
+                self.writer.send((RUNNING, factor))
+        except Exception as e:
+            self.writer.send((FAILED, e))
+        else:
+            self.writer.send((DONE, None))
+
+    def start(self):
+        # Only running jobs hold file descriptors
+        self.reader, self.writer = Pipe(duplex=False)
+        super().start()
+        self.writer.close()  # Only the child process writes
+        self.status = RUNNING
+
+    def receive(self):
+        try:
+            status, value = self.reader.recv()
+        except EOFError:
+            self.finish(FAILED)
+            self.error = RuntimeError(
+                f'Process exited with code {self.returncode}')
+            return None
+
+        if status == RUNNING:
+            self.factors.append(value)
+            return value
+
+        self.finish(status)
+        if status == FAILED:
+            self.error = value
+        return None
+
+    def finish(self, status):
+        self.status = status
+        self.reader.close()
+        super().join()
+        self.returncode = self.exitcode
+        self.close()  # Release the process sentinel too
+
+    def join(self, timeout=None):
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        while self.status == RUNNING:
+            remaining = None
+            if timeout is not None:
+                remaining = max(0, deadline - time.monotonic())
+            if not self.reader.poll(remaining):
+                return  # Timed out, like Thread.join
+            self.receive()
+
+    def cancel(self, status=CANCELLED):
+        if self.status == RUNNING:
+            self.terminate()
+            self.finish(status)
+        elif self.status == PENDING:
+            self.status = status  # Never started, so no pipe
+
+class FactorizeService:
+    def __init__(self, max_workers=None, func=factoring.factorize):
+        self.max_workers = max_workers or os.cpu_count()
+        self.func = func
+        self.jobs = {}
+        self.pending = deque()
+        self.running = {}  # Job ID to deadline
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, number, timeout=None):
+        job_id = len(self.jobs)
+        self.jobs[job_id] = FactorizeProcess(number, self.func)
+        self.pending.append((job_id, timeout))
+        return job_id
+
+    def cancel(self, job_id):
+        self.jobs[job_id].cancel()
+        self.running.pop(job_id, None)
+
+    def close(self):
+        for job_id in self.jobs:
+            self.cancel(job_id)
+
+    def start_pending(self):
+        while self.pending and len(self.running) < self.max_workers:
+            job_id, timeout = self.pending.popleft()
+            job = self.jobs[job_id]
+            if job.status != PENDING:
+                continue  # Cancelled before it started
+            job.start()
+            deadline = None
+            if timeout is not None:
+                deadline = time.monotonic() + timeout
+            self.running[job_id] = deadline
+
+    def next_deadline(self):
+        deadlines = [d for d in self.running.values() if d is not None]
+        if not deadlines:
+            return None
+        return max(0, min(deadlines) - time.monotonic())
+
+    def expire(self):
+        now = time.monotonic()
+        for job_id, deadline in list(self.running.items()):
+            if deadline is not None and deadline <= now:
+                self.jobs[job_id].cancel(TIMED_OUT)
+                del self.running[job_id]
+
+    def stream(self):
+        while True:
+            self.start_pending()
+            if not self.running:
+                return
+
+            readers = {
+                self.jobs[job_id].reader: job_id
+                for job_id in self.running
+            }
+            for reader in wait(list(readers), self.next_deadline()):
+                job_id = readers[reader]
+                job = self.jobs[job_id]
+                if job.status != RUNNING:
+                    continue  # Cancelled while streaming
+                factor = job.receive()
+                if factor is not None:
+                    yield job_id, job.number, factor
+                else:
+                    del self.running[job_id]
+
+            self.expire()
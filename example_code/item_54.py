@@ -142,3 +142,88 @@ for thread in threads:
 expected = how_many * 5
 found = counter.count
 print(f'Counter should be {expected}, got {found}')
+
+
+# Example 9
+from threading import local
+
+class ShardedCounter:
+    def __init__(self):
+        self.lock = Lock()   # Only guards the list of shards
+        self.shards = []
+        self.local = local()
+
+    def get_shard(self):
+        try:
+            return self.local.shard
+        except AttributeError:
+            shard = [0]      # Only this thread ever writes to it
+            with self.lock:
+                self.shards.append(shard)
+            self.local.shard = shard
+            return shard
+
+    def increment(self, offset):
+        self.get_shard()[0] += offset
+
+    def increment_many(self, offsets):
+        self.get_shard()[0] += sum(offsets)
+
+    def value(self):
+        with self.lock:
+            shards = list(self.shards)
+        return sum(shard[0] for shard in shards)
+
+
+# Example 10
+BARRIER = Barrier(5)
+counter = ShardedCounter()
+
+threads = []
+for i in range(5):
+    thread = Thread(target=worker,
+                    args=(i, how_many, counter))
+    threads.append(thread)
+    thread.start()
+
+for thread in threads:
+    thread.join()
+
+expected = how_many * 5
+found = counter.value()
+print(f'Counter should be {expected}, got {found}')
+assert found == expected
+
+
+# Example 11
+import time
+
+def batch_worker(sensor_index, how_many, counter):
+    BARRIER.wait()
+    for _ in range(how_many // 100):
+        readings = [1] * 100     # Read a batch from the sensor
+        counter.increment_many(readings)
+
+def benchmark(name, target, counter):
+    global BARRIER
+    BARRIER = Barrier(5)
+    threads = []
+    start = time.perf_counter()
+    for i in range(5):
+        thread = Thread(target=target,
+                        args=(i, how_many, counter))
+        threads.append(thread)
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    delta = time.perf_counter() - start
+    print(f'{name:>24}: {delta:.3f} seconds')
+
+benchmark('LockingCounter', worker, LockingCounter())
+benchmark('ShardedCounter', worker, ShardedCounter())
+
+counter = ShardedCounter()
+benchmark('ShardedCounter batched', batch_worker, counter)
+assert counter.value() == how_many * 5
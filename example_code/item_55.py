@@ -323,3 +323,677 @@ stop_threads(resize_queue, resize_threads)
 stop_threads(upload_queue, upload_threads)
 
 print(done_queue.qsize(), 'items finished')
+
+
+# Example 25
+from queue import Empty
+
+class BatchQueue(ClosableQueue):
+    def put_many(self, items):
+        with self.not_full:
+            added = 0
+            for item in items:
+                if self.maxsize > 0:
+                    while self._qsize() >= self.maxsize:
+                        self.not_empty.notify(added)
+                        added = 0
+                        self.not_full.wait()
+                self._put(item)
+                self.unfinished_tasks += 1
+                added += 1
+            self.not_empty.notify(added)
+
+    def get_many(self, max_items, timeout=None):
+        with self.not_empty:
+            if timeout is None:
+                while not self._qsize():
+                    self.not_empty.wait()
+            else:
+                deadline = time.monotonic() + timeout
+                while not self._qsize():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise Empty
+                    self.not_empty.wait(remaining)
+
+            items = []
+            while self._qsize() and len(items) < max_items:
+                item = self._get()
+                items.append(item)
+                if item is self.SENTINEL:
+                    break  # Leave the rest for other workers
+            self.not_full.notify(len(items))
+            return items
+
+    def task_done_many(self, count):
+        with self.all_tasks_done:
+            unfinished = self.unfinished_tasks - count
+            if unfinished <= 0:
+                if unfinished < 0:
+                    raise ValueError('task_done() called too many times')
+                self.all_tasks_done.notify_all()
+            self.unfinished_tasks = unfinished
+
+    def iter_batches(self, max_items):
+        while True:
+            batch = self.get_many(max_items)
+            try:
+                if batch[-1] is self.SENTINEL:
+                    if len(batch) > 1:
+                        yield batch[:-1]
+                    return  # Cause the thread to exit
+                yield batch
+            finally:
+                self.task_done_many(len(batch))
+
+
+# Example 26
+class BatchingWorker(StoppableWorker):
+    def __init__(self, func, in_queue, out_queue, batch_size=100):
+        super().__init__(func, in_queue, out_queue)
+        self.batch_size = batch_size
+
+    def run(self):
+        for batch in self.in_queue.iter_batches(self.batch_size):
+            results = [self.func(item) for item in batch]
+            self.out_queue.put_many(results)
+
+def start_batching_threads(count, *args):
+    threads = [BatchingWorker(*args) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+# Example 27
+def run_pipeline(queue_type, start_func, item_count):
+    download_queue = queue_type()
+    resize_queue = queue_type()
+    upload_queue = queue_type()
+    done_queue = queue_type()
+
+    download_threads = start_func(
+        3, download, download_queue, resize_queue)
+    resize_threads = start_func(
+        4, resize, resize_queue, upload_queue)
+    upload_threads = start_func(
+        5, upload, upload_queue, done_queue)
+
+    start = time.perf_counter()
+    items = [object() for _ in range(item_count)]
+    if queue_type is BatchQueue:
+        download_queue.put_many(items)
+    else:
+        for item in items:
+            download_queue.put(item)
+
+    stop_threads(download_queue, download_threads)
+    stop_threads(resize_queue, resize_threads)
+    stop_threads(upload_queue, upload_threads)
+    delta = time.perf_counter() - start
+
+    assert done_queue.qsize() == item_count
+    print(f'{queue_type.__name__:>14}: {item_count} items '
+          f'finished in {delta:.3f} seconds')
+
+run_pipeline(ClosableQueue, start_threads, 20_000)
+run_pipeline(BatchQueue, start_batching_threads, 20_000)
+
+
+# Example 28
+bounded = BatchQueue(maxsize=10)
+done_queue = BatchQueue()
+thread = BatchingWorker(upload, bounded, done_queue)
+thread.start()
+bounded.put_many(range(1000))   # Blocks until there is room
+bounded.close()
+bounded.join()
+thread.join()
+assert done_queue.get_many(2000) == list(range(1000))
+
+try:
+    done_queue.get_many(10, timeout=0.01)
+except Empty:
+    pass  # Expected
+else:
+    assert False
+
+
+# Example 29
+from threading import Event
+
+class AutoscalingStage:
+    def __init__(self, func, in_queue, out_queue,
+                 min_workers=1, max_workers=8, high_water=10,
+                 idle_samples=20):
+        self.func = func
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.high_water = high_water
+        self.idle_samples = idle_samples
+        self.idle = 0          # Consecutive samples with no backlog
+        self.threads = []
+        self.workers = 0
+        self.peak_workers = 0
+        self.shrinks = 0
+        for _ in range(min_workers):
+            self.grow()
+
+    def grow(self):
+        thread = StoppableWorker(
+            self.func, self.in_queue, self.out_queue)
+        thread.start()
+        self.threads.append(thread)
+        self.workers += 1
+        self.peak_workers = max(self.peak_workers, self.workers)
+
+    def shrink(self):
+        self.in_queue.close()  # The next free worker exits
+        self.workers -= 1
+        self.shrinks += 1
+
+    def adjust(self):
+        self.threads = [t for t in self.threads if t.is_alive()]
+        depth = self.in_queue.qsize()
+        self.idle = self.idle + 1 if depth == 0 else 0
+        if (depth > self.high_water * self.workers and
+                self.workers < self.max_workers):
+            self.grow()
+        elif (self.idle >= self.idle_samples and
+                self.workers > self.min_workers):
+            self.shrink()
+            self.idle = 0      # Wait again before the next one
+
+    def stop(self):
+        for _ in range(self.workers):
+            self.in_queue.close()
+
+        self.in_queue.join()
+
+        for thread in self.threads:
+            thread.join()
+
+
+# Example 30
+class AutoscalingPipeline:
+    def __init__(self, stages, interval=0.01):
+        self.stages = stages
+        self.interval = interval
+        self.stopped = Event()
+        self.monitor = Thread(target=self.watch)
+
+    def watch(self):
+        while not self.stopped.wait(self.interval):
+            for stage in self.stages:
+                stage.adjust()
+
+    def start(self):
+        self.monitor.start()
+
+    def stop(self):
+        for stage in self.stages:  # Keep scaling while draining
+            stage.in_queue.join()
+
+        self.stopped.set()
+        self.monitor.join()
+        for stage in self.stages:
+            stage.stop()
+
+
+# Example 31
+def slow_resize(item):
+    time.sleep(0.001)  # Blocking I/O would go here
+    return item
+
+download_queue = ClosableQueue()
+resize_queue = ClosableQueue()
+upload_queue = ClosableQueue()
+done_queue = ClosableQueue()
+
+stages = [
+    AutoscalingStage(download, download_queue, resize_queue),
+    AutoscalingStage(slow_resize, resize_queue, upload_queue),
+    AutoscalingStage(upload, upload_queue, done_queue),
+]
+pipeline = AutoscalingPipeline(stages)
+pipeline.start()
+
+for _ in range(2000):
+    download_queue.put(object())
+
+for stage in stages:
+    stage.in_queue.join()
+
+deadline = time.monotonic() + 5
+while stages[1].workers > stages[1].min_workers:  # Idle phase
+    assert time.monotonic() < deadline
+    time.sleep(0.05)
+
+pipeline.stop()
+
+print(done_queue.qsize(), 'items finished')
+for name, stage in zip(['download', 'resize', 'upload'], stages):
+    print(f'{name} peaked at {stage.peak_workers} workers, '
+          f'shrank {stage.shrinks} times')
+
+assert done_queue.qsize() == 2000
+assert stages[1].peak_workers > 1
+assert stages[1].shrinks > 0
+assert stages[1].workers == stages[1].min_workers
+
+
+# Example 32
+class Histogram:
+    def __init__(self):
+        # Bucket i counts durations under 2**i microseconds
+        self.buckets = [0] * 32
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds):
+        micros = int(seconds * 1_000_000)
+        self.buckets[min(micros.bit_length(), 31)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def merge(self, other):
+        for i, count in enumerate(other.buckets):
+            self.buckets[i] += count
+        self.count += other.count
+        self.total += other.total
+
+    def snapshot(self):
+        mean = self.total / self.count if self.count else 0.0
+        buckets = {
+            f'<{2 ** i}us': count
+            for i, count in enumerate(self.buckets)
+            if count
+        }
+        return {
+            'count': self.count,
+            'mean_seconds': mean,
+            'buckets': buckets,
+        }
+
+
+# Example 33
+class InstrumentedQueue(ClosableQueue):
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        self.wait_times = Histogram()
+
+    # These are called with the queue's mutex held
+    def _put(self, item):
+        self.queue.append((time.perf_counter(), item))
+
+    def _get(self):
+        enqueued, item = self.queue.popleft()
+        if item is not self.SENTINEL:
+            self.wait_times.record(time.perf_counter() - enqueued)
+        return item
+
+    def wait_snapshot(self):
+        with self.mutex:
+            return self.wait_times.snapshot()
+
+class InstrumentedWorker(StoppableWorker):
+    def __init__(self, func, in_queue, out_queue):
+        super().__init__(func, in_queue, out_queue)
+        self.service_times = Histogram()
+
+    def run(self):
+        for item in self.in_queue:
+            start = time.perf_counter()
+            result = self.func(item)
+            self.service_times.record(time.perf_counter() - start)
+            self.out_queue.put(result)
+
+def start_instrumented_threads(count, *args):
+    threads = [InstrumentedWorker(*args) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+# Example 34
+class PipelineMonitor(Thread):
+    def __init__(self, stages, interval=1.0):
+        super().__init__(daemon=True)
+        self.stages = stages  # Name to (in_queue, threads)
+        self.interval = interval
+        self.stopped = Event()
+        # Name to (timestamp, depth, items) for the last 100 samples
+        self.samples = {name: deque(maxlen=100) for name in stages}
+
+    def start(self):
+        self.sample()         # Rates are measured from here
+        super().start()
+
+    def run(self):
+        logger = logging.getLogger()
+        while not self.stopped.wait(self.interval):
+            self.sample()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(self.log_line())
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+    def sample(self):
+        now = time.perf_counter()
+        for name, (queue, threads) in self.stages.items():
+            items = sum(t.service_times.count for t in threads)
+            self.samples[name].append((now, queue.qsize(), items))
+
+    def snapshot(self):
+        now = time.perf_counter()
+        stats = {}
+        for name, (queue, threads) in self.stages.items():
+            service = Histogram()
+            for thread in threads:
+                service.merge(thread.service_times)
+            samples = list(self.samples[name])
+            depths = [depth for _, depth, _ in samples]
+            if samples:
+                since, _, before = samples[0]  # Oldest in the window
+                rate = (service.count - before) / (now - since)
+            else:
+                rate = 0.0
+            stats[name] = {
+                'workers': len(threads),
+                'items': service.count,
+                'items_per_second': rate,
+                'service_time': service.snapshot(),
+                'queue_wait': queue.wait_snapshot(),
+                'queue_depth': {
+                    'last': depths[-1] if depths else 0,
+                    'max': max(depths, default=0),
+                    'mean': sum(depths) / len(depths) if depths else 0,
+                },
+            }
+        return stats
+
+    def log_line(self):
+        parts = []
+        for name, stats in self.snapshot().items():
+            service_ms = stats['service_time']['mean_seconds'] * 1000
+            wait_ms = stats['queue_wait']['mean_seconds'] * 1000
+            parts.append(
+                f'{name} {stats["items_per_second"]:.0f}/s '
+                f'depth={stats["queue_depth"]["last"]} '
+                f'service={service_ms:.3f}ms wait={wait_ms:.3f}ms')
+        return ' | '.join(parts)
+
+
+# Example 35
+download_queue = InstrumentedQueue()
+resize_queue = InstrumentedQueue()
+upload_queue = InstrumentedQueue()
+done_queue = InstrumentedQueue()
+
+download_threads = start_instrumented_threads(
+    3, download, download_queue, resize_queue)
+resize_threads = start_instrumented_threads(
+    4, slow_resize, resize_queue, upload_queue)
+upload_threads = start_instrumented_threads(
+    5, upload, upload_queue, done_queue)
+
+monitor = PipelineMonitor({
+    'download': (download_queue, download_threads),
+    'resize': (resize_queue, resize_threads),
+    'upload': (upload_queue, upload_threads),
+}, interval=0.01)
+monitor.start()
+
+for _ in range(1000):
+    download_queue.put(object())
+
+stop_threads(download_queue, download_threads)
+stop_threads(resize_queue, resize_threads)
+stop_threads(upload_queue, upload_threads)
+monitor.stop()
+
+print(monitor.log_line())
+stats = monitor.snapshot()
+pprint(stats['resize'])
+assert stats['resize']['items'] == 1000
+assert stats['resize']['queue_wait']['count'] == 1000
+
+
+# Example 36
+from threading import Condition
+
+class QueueClosed(Exception):
+    pass
+
+class BlockingQueue:
+    def __init__(self, capacity=0):
+        self.items = deque()
+        self.capacity = capacity  # Zero means unbounded
+        self.closed = False
+        self.lock = Lock()
+        self.not_empty = Condition(self.lock)
+        self.not_full = Condition(self.lock)
+
+    def put(self, item):
+        with self.not_full:
+            while True:
+                if self.closed:
+                    raise QueueClosed
+                if not self.capacity or len(self.items) < self.capacity:
+                    break
+                self.not_full.wait()      # Backpressure
+            self.items.append(item)
+            self.not_empty.notify()
+
+    def get(self):
+        with self.not_empty:
+            while not self.items:
+                if self.closed:
+                    raise QueueClosed
+                self.not_empty.wait()     # No polling
+            item = self.items.popleft()
+            self.not_full.notify()
+            return item
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.not_empty.notify_all()
+            self.not_full.notify_all()
+
+
+# Example 37
+class BlockingWorker(Worker):
+    def run(self):
+        while True:
+            self.polled_count += 1
+            try:
+                item = self.in_queue.get()
+            except QueueClosed:
+                return
+            result = self.func(item)
+            self.out_queue.put(result)
+            self.work_done += 1
+
+def stop_polling(queues, threads):
+    for thread in threads:
+        thread.in_queue = None
+        thread.join()
+
+def stop_blocking(queues, threads):
+    for queue, thread in zip(queues, threads):
+        queue.close()
+        thread.join()
+
+
+# Example 38
+def start_stages(queue_type, worker_type, last_func):
+    queues = [queue_type() for _ in range(4)]
+    threads = [
+        worker_type(download, queues[0], queues[1]),
+        worker_type(resize, queues[1], queues[2]),
+        worker_type(last_func, queues[2], queues[3]),
+    ]
+    for thread in threads:
+        thread.start()
+    return queues, threads
+
+def measure(queue_type, worker_type, stop):
+    queues, threads = start_stages(queue_type, worker_type, upload)
+    start = time.process_time()
+    time.sleep(0.5)                      # Every stage is idle
+    idle_cpu = time.process_time() - start
+    stop(queues, threads)
+
+    latencies = []
+
+    def record(sent):
+        latencies.append(time.perf_counter() - sent)
+        return sent
+
+    queues, threads = start_stages(queue_type, worker_type, record)
+    for _ in range(20):
+        queues[0].put(time.perf_counter())
+        time.sleep(0.02)
+    while len(queues[-1].items) < 20:
+        time.sleep(0.01)
+    stop(queues, threads)
+
+    latencies.sort()
+    median = latencies[len(latencies) // 2]
+    polled = sum(t.polled_count for t in threads)
+    print(f'{worker_type.__name__:>14}: idle CPU {idle_cpu:.3f} '
+          f'seconds, median latency {median * 1000:.3f}ms, '
+          f'polled {polled} times')
+
+measure(MyQueue, Worker, stop_polling)
+measure(BlockingQueue, BlockingWorker, stop_blocking)
+
+
+# Example 39
+bounded = BlockingQueue(capacity=2)
+done = BlockingQueue()
+thread = BlockingWorker(upload, bounded, done)
+thread.start()
+for i in range(100):
+    bounded.put(i)                       # Waits when full
+    assert len(bounded.items) <= 2
+bounded.close()
+thread.join()
+assert list(done.items) == list(range(100))
+assert thread.work_done == 100
+
+full = BlockingQueue(capacity=1)
+full.put(1)
+errors = []
+
+def blocked_put():
+    try:
+        full.put(2)                      # Waits until closed
+    except QueueClosed:
+        errors.append('closed')
+
+producer = Thread(target=blocked_put)
+producer.start()
+time.sleep(0.1)
+full.close()
+producer.join(timeout=1)
+assert not producer.is_alive()
+assert errors == ['closed']
+assert list(full.items) == [1]
+
+
+# Example 40
+import asyncio
+import inspect
+
+class AsyncClosableQueue(asyncio.Queue):
+    SENTINEL = object()
+
+    async def close(self):
+        await self.put(self.SENTINEL)
+
+    async def __aiter__(self):
+        while True:
+            item = await self.get()
+            try:
+                if item is self.SENTINEL:
+                    return  # Cause the coroutine to exit
+                yield item
+            finally:
+                self.task_done()
+
+async def consume(func, in_queue, out_queue, executor=None):
+    loop = asyncio.get_running_loop()
+    async for item in in_queue:
+        if inspect.iscoroutinefunction(func):
+            result = await func(item)
+        elif executor is not None:
+            result = await loop.run_in_executor(executor, func, item)
+        else:
+            result = await asyncio.to_thread(func, item)
+        await out_queue.put(result)
+
+
+# Example 41
+def start_tasks(count, *args):
+    return [asyncio.create_task(consume(*args)) for _ in range(count)]
+
+async def stop_tasks(closable_queue, tasks):
+    for _ in tasks:
+        await closable_queue.close()
+
+    await closable_queue.join()
+    await asyncio.gather(*tasks)
+
+
+# Example 42
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+async def download_async(item):
+    await asyncio.sleep(0.01)  # Non-blocking I/O would go here
+    return item
+
+async def upload_async(item):
+    await asyncio.sleep(0.01)
+    return item
+
+async def run_async_pipeline(item_count, executor=None):
+    download_queue = AsyncClosableQueue()
+    resize_queue = AsyncClosableQueue()
+    upload_queue = AsyncClosableQueue()
+    done_queue = AsyncClosableQueue()
+
+    download_tasks = start_tasks(
+        2000, download_async, download_queue, resize_queue)
+    resize_tasks = start_tasks(
+        4, resize, resize_queue, upload_queue, executor)
+    upload_tasks = start_tasks(
+        2000, upload_async, upload_queue, done_queue)
+
+    for _ in range(item_count):
+        await download_queue.put(object())
+
+    await stop_tasks(download_queue, download_tasks)
+    await stop_tasks(resize_queue, resize_tasks)
+    await stop_tasks(upload_queue, upload_tasks)
+
+    return done_queue.qsize(), threading.active_count()
+
+start = time.perf_counter()
+finished, thread_count = asyncio.run(run_async_pipeline(20_000))
+delta = time.perf_counter() - start
+print(f'{finished} items finished in {delta:.3f} seconds '
+      f'with {thread_count} threads')
+assert finished == 20_000
+
+with ThreadPoolExecutor(max_workers=2) as executor:
+    pipeline = run_async_pipeline(1000, executor)
+    finished, thread_count = asyncio.run(pipeline)
+print(f'{finished} items finished with {thread_count} threads')
+assert finished == 1000
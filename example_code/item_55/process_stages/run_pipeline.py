@@ -0,0 +1,70 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from stages import ClosableQueue, SharedMemoryQueue
+from stages import ProcessWorker, StoppableWorker
+from stages import start_workers, stop_workers
+import os
+import time
+
+PAYLOAD_SIZE = 256 * 1024
+
+def download(item):
+    return bytes(range(256)) * (PAYLOAD_SIZE // 256)
+
+def resize(payload):
+    # CPU-bound: average each pair of neighboring bytes
+    pairs = zip(payload[::2], payload[1::2])
+    return bytes((a + b) // 2 for a, b in pairs)
+
+def upload(payload):
+    return len(payload)
+
+def run(resize_type, queue_type, item_count):
+    download_queue = ClosableQueue()
+    resize_queue = queue_type()
+    upload_queue = queue_type()
+    done_queue = ClosableQueue()
+
+    start = time.time()
+    download_workers = start_workers(
+        StoppableWorker, 2, download, download_queue, resize_queue)
+    resize_workers = start_workers(
+        resize_type, os.cpu_count(), resize, resize_queue, upload_queue)
+    upload_workers = start_workers(
+        StoppableWorker, 2, upload, upload_queue, done_queue)
+
+    for i in range(item_count):
+        download_queue.put(i)
+
+    stop_workers(download_queue, download_workers)
+    stop_workers(resize_queue, resize_workers)
+    stop_workers(upload_queue, upload_workers)
+    end = time.time()
+
+    assert done_queue.qsize() == item_count
+    for item in done_queue.queue:
+        assert item == PAYLOAD_SIZE // 2
+
+    delta = end - start
+    print(f'{resize_type.__name__} took {delta:.3f} seconds')
+
+def main():
+    run(StoppableWorker, ClosableQueue, 40)
+    run(ProcessWorker, SharedMemoryQueue, 40)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from multiprocessing import JoinableQueue, Process
+from multiprocessing import resource_tracker, shared_memory
+from queue import Queue
+from threading import Thread
+
+class ClosableQueue(Queue):
+    SENTINEL = object()
+
+    def close(self):
+        self.put(self.SENTINEL)
+
+    def __iter__(self):
+        while True:
+            item = self.get()
+            try:
+                if item is self.SENTINEL:
+                    return  # Cause the thread to exit
+                yield item
+            finally:
+                self.task_done()
+
+class StoppableWorker(Thread):
+    def __init__(self, func, in_queue, out_queue):
+        super().__init__()
+        self.func = func
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+
+    def run(self):
+        for item in self.in_queue:
+            result = self.func(item)
+            self.out_queue.put(result)
+
+# Payloads travel as shared memory blocks; only the block's name
+# and size are pickled. Whoever gets an item unlinks its block.
+class SharedMemoryQueue:
+    SENTINEL = None  # Unlike object(), None survives pickling
+
+    def __init__(self):
+        self.queue = JoinableQueue()
+        # Worker processes must inherit the same tracker, otherwise
+        # blocks unlinked by another process look leaked at exit.
+        # Windows frees shared memory without a tracker.
+        if os.name == 'posix':
+            resource_tracker.ensure_running()
+
+    def put(self, payload):
+        size = len(payload)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+        shm.buf[:size] = payload
+        self.queue.put((shm.name, size))
+        shm.close()
+
+    def get(self):
+        message = self.queue.get()
+        if message is self.SENTINEL:
+            return self.SENTINEL
+        name, size = message
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            return bytes(shm.buf[:size])
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def task_done(self):
+        self.queue.task_done()
+
+    def join(self):
+        self.queue.join()
+
+    def close(self):
+        self.queue.put(self.SENTINEL)
+
+    def __iter__(self):
+        while True:
+            item = self.get()
+            try:
+                if item is self.SENTINEL:
+                    return  # Cause the process to exit
+                yield item
+            finally:
+                self.task_done()
+
+class ProcessWorker(Process):
+    def __init__(self, func, in_queue, out_queue):
+        super().__init__()
+        self.func = func
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+
+    def run(self):
+        for item in self.in_queue:
+            result = self.func(item)
+            self.out_queue.put(result)
+
+def start_workers(worker_type, count, *args):
+    workers = [worker_type(*args) for _ in range(count)]
+    for worker in workers:
+        worker.start()
+    return workers
+
+def stop_workers(closable_queue, workers):
+    for _ in workers:
+        closable_queue.close()
+
+    closable_queue.join()
+
+    for worker in workers:
+        worker.join()
@@ -226,3 +226,736 @@ print(columns)
 def game_logic(state, neighbors):
     # Do some blocking input/output in here:
     data = my_socket.recv(100)
+
+
+# Example 10
+# Restore the working version of this function
+def game_logic(state, neighbors):
+    if state == ALIVE:
+        if neighbors < 2:
+            return EMPTY     # Die: Too few
+        elif neighbors > 3:
+            return EMPTY     # Die: Too many
+    else:
+        if neighbors == 3:
+            return ALIVE     # Regenerate
+    return state
+
+# Each byte holds eight cells; bit i is column (8 * byte + i)
+BYTE_CELLS = [
+    ''.join(ALIVE if (value >> i) & 1 else EMPTY for i in range(8))
+    for value in range(256)
+]
+
+class PackedGrid:
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.stride = (width + 7) // 8
+        self.bits = bytearray(self.height * self.stride)
+
+    def get(self, y, x):
+        y %= self.height
+        x %= self.width
+        if self.bits[y * self.stride + (x >> 3)] & (1 << (x & 7)):
+            return ALIVE
+        return EMPTY
+
+    def set(self, y, x, state):
+        y %= self.height
+        x %= self.width
+        index = y * self.stride + (x >> 3)
+        mask = 1 << (x & 7)
+        if state == ALIVE:
+            self.bits[index] |= mask
+        else:
+            self.bits[index] &= ~mask
+
+    def __str__(self):
+        output = []
+        for start in range(0, len(self.bits), self.stride):
+            row_bytes = self.bits[start:start + self.stride]
+            row = ''.join(BYTE_CELLS[value] for value in row_bytes)
+            output.append(row[:self.width])
+            output.append('\n')
+        return ''.join(output)
+
+
+# Example 11
+def simulate(grid):
+    next_grid = type(grid)(grid.height, grid.width)  # Changed
+    for y in range(grid.height):
+        for x in range(grid.width):
+            step_cell(y, x, grid.get, next_grid.set)
+    return next_grid
+
+grid = Grid(5, 9)
+packed = PackedGrid(5, 9)
+for board in (grid, packed):
+    board.set(0, 3, ALIVE)
+    board.set(1, 4, ALIVE)
+    board.set(2, 2, ALIVE)
+    board.set(2, 3, ALIVE)
+    board.set(2, 4, ALIVE)
+
+for i in range(5):
+    assert str(packed) == str(grid)
+    grid = simulate(grid)
+    packed = simulate(packed)
+
+print(packed)
+
+
+# Example 12
+import sys
+
+def grid_size(grid):
+    total = sys.getsizeof(grid.rows)
+    for row in grid.rows:
+        total += sys.getsizeof(row)
+    return total
+
+big_grid = Grid(1000, 1000)
+big_packed = PackedGrid(1000, 1000)
+print(f'Grid:       {grid_size(big_grid):>10,} bytes')
+print(f'PackedGrid: {sys.getsizeof(big_packed.bits):>10,} bytes')
+
+
+# Example 13
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def grid_to_cells(grid):
+    cells = []
+    for y in range(grid.height):
+        row = [1 if grid.get(y, x) == ALIVE else 0
+               for x in range(grid.width)]
+        cells.append(row)
+    return cells
+
+def cells_to_grid(cells, grid_type=Grid):
+    grid = grid_type(len(cells), len(cells[0]))
+    for y, row in enumerate(cells):
+        for x, alive in enumerate(row):
+            if alive:
+                grid.set(y, x, ALIVE)
+    return grid
+
+
+# Example 14
+def step_rows(cells):
+    height = len(cells)
+    next_cells = []
+    for y in range(height):
+        above = cells[y - 1]
+        row = cells[y]
+        below = cells[(y + 1) % height]
+        columns = [a + b + c for a, b, c in zip(above, row, below)]
+        west = columns[-1:] + columns[:-1]  # Wrap around
+        east = columns[1:] + columns[:1]
+        next_row = []
+        for alive, w, c, e in zip(row, west, columns, east):
+            neighbors = w + c + e - alive
+            if neighbors == 3 or (alive and neighbors == 2):
+                next_row.append(1)
+            else:
+                next_row.append(0)
+        next_cells.append(next_row)
+    return next_cells
+
+def step_arrays(cells):
+    neighbors = sum(
+        numpy.roll(cells, (dy, dx), axis=(0, 1))
+        for dy in (-1, 0, 1)
+        for dx in (-1, 0, 1)
+        if dy or dx)
+    alive = (neighbors == 3) | ((cells == 1) & (neighbors == 2))
+    return alive.astype(numpy.uint8)
+
+
+# Example 15
+def simulate_vectorized(grid, generations=1):
+    cells = grid_to_cells(grid)
+    if numpy is not None:
+        cells = numpy.array(cells, dtype=numpy.uint8)
+        for _ in range(generations):
+            cells = step_arrays(cells)
+        cells = cells.tolist()
+    else:
+        for _ in range(generations):
+            cells = step_rows(cells)
+    return cells_to_grid(cells, type(grid))
+
+
+# Example 16
+import time
+
+def random_grid(height, width, grid_type=Grid, density=0.3):
+    grid = grid_type(height, width)
+    for y in range(height):
+        for x in range(width):
+            if random.random() < density:
+                grid.set(y, x, ALIVE)
+    return grid
+
+grid = random_grid(20, 30)
+expected = grid
+for _ in range(10):
+    expected = simulate(expected)
+
+assert str(simulate_vectorized(grid, 10)) == str(expected)
+packed = random_grid(20, 30, PackedGrid)
+assert str(simulate_vectorized(packed)) == str(simulate(packed))
+
+grid = random_grid(100, 100)
+
+start = time.time()
+for _ in range(5):
+    grid = simulate(grid)
+end = time.time()
+print(f'simulate took {end - start:.3f} seconds')
+
+start = time.time()
+grid = simulate_vectorized(grid, 5)
+end = time.time()
+print(f'simulate_vectorized took {end - start:.3f} seconds')
+
+
+# Example 17
+from collections import Counter
+
+NEIGHBOR_OFFSETS = [
+    (-1, 0), (-1, 1), (0, 1), (1, 1),
+    (1, 0), (1, -1), (0, -1), (-1, -1),
+]
+
+def grid_to_live(grid):
+    live = set()
+    for y in range(grid.height):
+        for x in range(grid.width):
+            if grid.get(y, x) == ALIVE:
+                live.add((y, x))
+    return live
+
+def live_to_grid(live, height, width, grid_type=Grid):
+    grid = grid_type(height, width)
+    for y, x in live:
+        grid.set(y, x, ALIVE)
+    return grid
+
+def simulate_sparse(live, height, width):
+    if game_logic(EMPTY, 0) == ALIVE:
+        raise ValueError('Sparse simulation needs a rule without B0')
+
+    counts = Counter()
+    for y, x in live:
+        counts[y, x] += 0  # Isolated cells need a decision too
+        for dy, dx in NEIGHBOR_OFFSETS:
+            counts[(y + dy) % height, (x + dx) % width] += 1
+
+    next_live = set()
+    for position, neighbors in counts.items():
+        state = ALIVE if position in live else EMPTY
+        if game_logic(state, neighbors) == ALIVE:
+            next_live.add(position)
+    return next_live
+
+
+# Example 18
+grid = random_grid(20, 30)
+live = grid_to_live(grid)
+for _ in range(10):
+    grid = simulate(grid)
+    live = simulate_sparse(live, 20, 30)
+    assert str(live_to_grid(live, 20, 30)) == str(grid)
+
+live = {(0, 3), (1, 4), (2, 2), (2, 3), (2, 4)}
+start = time.time()
+for _ in range(100):
+    live = simulate_sparse(live, 10_000, 10_000)
+end = time.time()
+print(f'{len(live)} live cells after {end - start:.3f} seconds')
+
+
+# Example 19
+def simulate_incremental(grid, changed):
+    active = set()
+    for y, x in changed:
+        active.add((y, x))
+        for dy, dx in NEIGHBOR_OFFSETS:
+            active.add(((y + dy) % grid.height, (x + dx) % grid.width))
+
+    updates = []
+    for y, x in active:
+        state = grid.get(y, x)
+        neighbors = count_neighbors(y, x, grid.get)
+        next_state = game_logic(state, neighbors)
+        if next_state != state:
+            updates.append((y, x, next_state))
+
+    next_changed = set()
+    for y, x, next_state in updates:  # Apply after reading everything
+        grid.set(y, x, next_state)
+        next_changed.add((y, x))
+
+    return next_changed, len(active)
+
+
+# Example 20
+grid = random_grid(20, 30)
+expected = Grid(20, 30)
+expected.rows = [list(row) for row in grid.rows]
+
+changed = {(y, x) for y in range(20) for x in range(30)}
+active_counts = []
+for _ in range(30):
+    changed, active = simulate_incremental(grid, changed)
+    active_counts.append(active)
+    expected = simulate(expected)
+    assert str(grid) == str(expected)
+
+print('Active cells per generation:', active_counts)
+
+
+# Example 21
+def simulate_into(grid, next_grid):
+    for y in range(grid.height):
+        for x in range(grid.width):
+            step_cell(y, x, grid.get, next_grid.set)
+
+class DoubleBuffer:
+    def __init__(self, grid):
+        self.current = type(grid)(grid.height, grid.width)
+        self.next = type(grid)(grid.height, grid.width)
+        for y in range(grid.height):
+            for x in range(grid.width):
+                self.current.set(y, x, grid.get(y, x))
+
+    def step(self):
+        simulate_into(self.current, self.next)
+        self.current, self.next = self.next, self.current
+        return self.current
+
+grid = random_grid(20, 30)
+expected = simulate(simulate(grid))
+buffers = DoubleBuffer(grid)
+buffers.step()
+assert str(buffers.step()) == str(expected)
+
+
+# Example 22
+import tracemalloc
+
+def allocating_stepper(grid):
+    return simulate
+
+def double_buffered_stepper(grid):
+    buffers = DoubleBuffer(grid)
+    return lambda _: buffers.step()
+
+def run(make_step, grid, generations, trace=False):
+    step = make_step(grid)
+    rise = 0
+    for _ in range(generations):
+        if trace:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+        grid = step(grid)
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+            rise += peak - before    # Peak growth this generation
+    return grid, rise
+
+def benchmark(make_step, grid, generations):
+    start = time.perf_counter()
+    result, _ = run(make_step, grid, generations)
+    delta = time.perf_counter() - start
+
+    tracemalloc.start()
+    _, rise = run(make_step, grid, generations, trace=True)
+    tracemalloc.stop()
+
+    print(f'{make_step.__name__:>23}: {delta:.3f} seconds, '
+          f'traced peak rises {rise / generations:,.0f} bytes '
+          f'per generation')
+    return result, rise
+
+grid = random_grid(32, 32)
+first, allocated = benchmark(allocating_stepper, grid, 1000)
+second, reused = benchmark(double_buffered_stepper, grid, 1000)
+assert str(first) == str(second)
+assert reused < allocated / 10
+
+
+# Example 23
+def compile_rule(rulestring):
+    birth, _, survival = rulestring.upper().partition('/')
+    if not (birth.startswith('B') and survival.startswith('S')):
+        raise ValueError(f'Invalid rulestring: {rulestring!r}')
+
+    digits = birth[1:] + survival[1:]
+    if not all(digit in '012345678' for digit in digits):
+        raise ValueError(f'Invalid neighbor count in {rulestring!r}')
+
+    table = {}
+    for neighbors in range(9):
+        born = str(neighbors) in birth[1:]
+        survives = str(neighbors) in survival[1:]
+        table[EMPTY, neighbors] = ALIVE if born else EMPTY
+        table[ALIVE, neighbors] = ALIVE if survives else EMPTY
+    return table
+
+def make_game_logic(table):
+    def game_logic(state, neighbors):
+        return table[state, neighbors]
+    return game_logic
+
+CONWAY = compile_rule('B3/S23')
+HIGHLIFE = compile_rule('B36/S23')
+
+for state in (ALIVE, EMPTY):
+    for neighbors in range(9):
+        expected = game_logic(state, neighbors)
+        assert CONWAY[state, neighbors] == expected
+
+for rulestring in ('B9/S23', 'Bx/S23', 'B3/S23/C4'):
+    try:
+        compile_rule(rulestring)
+    except ValueError:
+        pass  # Expected
+    else:
+        assert False
+
+
+# Example 24
+def rule_to_lookup(logic):
+    lookup = []
+    for state in (EMPTY, ALIVE):
+        row = [1 if logic(state, neighbors) == ALIVE else 0
+               for neighbors in range(9)]
+        lookup.append(row)
+    return lookup
+
+def step_rows(cells, lookup):
+    height = len(cells)
+    next_cells = []
+    for y in range(height):
+        above = cells[y - 1]
+        row = cells[y]
+        below = cells[(y + 1) % height]
+        columns = [a + b + c for a, b, c in zip(above, row, below)]
+        west = columns[-1:] + columns[:-1]
+        east = columns[1:] + columns[:1]
+        next_row = []
+        for alive, w, c, e in zip(row, west, columns, east):
+            neighbors = w + c + e - alive
+            next_row.append(lookup[alive][neighbors])  # Changed
+        next_cells.append(next_row)
+    return next_cells
+
+def step_arrays(cells, lookup):
+    neighbors = sum(
+        numpy.roll(cells, (dy, dx), axis=(0, 1))
+        for dy in (-1, 0, 1)
+        for dx in (-1, 0, 1)
+        if dy or dx)
+    return lookup[cells, neighbors]                     # Changed
+
+def simulate_vectorized(grid, generations=1):
+    lookup = rule_to_lookup(game_logic)  # Changed
+    cells = grid_to_cells(grid)
+    if numpy is not None:
+        lookup = numpy.array(lookup, dtype=numpy.uint8)
+        cells = numpy.array(cells, dtype=numpy.uint8)
+        for _ in range(generations):
+            cells = step_arrays(cells, lookup)
+        cells = cells.tolist()
+    else:
+        for _ in range(generations):
+            cells = step_rows(cells, lookup)
+    return cells_to_grid(cells, type(grid))
+
+
+# Example 25
+game_logic = make_game_logic(HIGHLIFE)
+
+grid = random_grid(20, 30)
+expected = grid
+for _ in range(10):
+    expected = simulate(expected)
+
+live = grid_to_live(grid)
+buffers = DoubleBuffer(grid)
+changed = {(y, x) for y in range(20) for x in range(30)}
+incremental = cells_to_grid(grid_to_cells(grid))
+for _ in range(10):
+    live = simulate_sparse(live, 20, 30)
+    buffers.step()
+    changed, _ = simulate_incremental(incremental, changed)
+
+assert str(live_to_grid(live, 20, 30)) == str(expected)
+assert str(buffers.current) == str(expected)
+assert str(incremental) == str(expected)
+assert str(simulate_vectorized(grid, 10)) == str(expected)
+
+game_logic = make_game_logic(compile_rule('B0/S8'))
+try:
+    simulate_sparse(live, 20, 30)
+except ValueError:
+    pass  # Expected
+else:
+    assert False
+
+game_logic = make_game_logic(CONWAY)
+assert str(simulate_vectorized(grid, 10)) != str(expected)
+
+
+# Example 26
+def write_grid(grid, output):
+    for y in range(grid.height):
+        row = ''.join(grid.get(y, x) for x in range(grid.width))
+        output.write(row)
+        output.write('\n')
+
+def stream_generations(grid, generations, output, step=simulate):
+    for i in range(generations):
+        output.write(f'Generation {i}\n')
+        write_grid(grid, output)
+        grid = step(grid)
+    return grid
+
+grid = random_grid(20, 30)
+with open('generations.txt', 'w') as f:
+    stream_generations(grid, 100, f)
+
+with open('generations.txt') as f:
+    line_count = sum(1 for _ in f)
+
+assert line_count == 100 * (20 + 1)
+print(f'Wrote {line_count} lines')
+
+
+# Example 27
+def encode_run(count, tag):
+    if count == 1:
+        return tag
+    return f'{count}{tag}'
+
+def iter_rle_tokens(grid):
+    row_ends = 0
+    for y in range(grid.height):
+        runs = []
+        for x in range(grid.width):
+            tag = 'o' if grid.get(y, x) == ALIVE else 'b'
+            if runs and runs[-1][1] == tag:
+                runs[-1][0] += 1
+            else:
+                runs.append([1, tag])
+
+        if runs and runs[-1][1] == 'b':
+            runs.pop()  # Trailing dead cells are implied
+
+        if runs:
+            if row_ends:
+                yield encode_run(row_ends, '$')
+            row_ends = 0
+            for count, tag in runs:
+                yield encode_run(count, tag)
+
+        row_ends += 1
+
+    yield '!'
+
+def write_rle(grid, output, rule='B3/S23'):
+    output.write(f'x = {grid.width}, y = {grid.height}, '
+                 f'rule = {rule}\n')
+    line_length = 0
+    for token in iter_rle_tokens(grid):
+        if line_length + len(token) > 70:
+            output.write('\n')
+            line_length = 0
+        output.write(token)
+        line_length += len(token)
+    output.write('\n')
+
+
+# Example 28
+def parse_rle_header(line):
+    fields = {}
+    for part in line.split(','):
+        key, _, value = part.partition('=')
+        fields[key.strip()] = value.strip()
+
+    height, width = fields.get('y', ''), fields.get('x', '')
+    if not (height.isdigit() and width.isdigit()):
+        raise ValueError(f'Invalid RLE header: {line!r}')
+    return int(height), int(width)
+
+def read_rle(lines, grid_type=Grid):
+    grid = None
+    y = x = 0
+    digits = ''
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        if grid is None:
+            height, width = parse_rle_header(line)
+            grid = grid_type(height, width)
+            continue
+
+        for char in line:
+            if char.isdigit():
+                digits += char
+                continue
+
+            count = int(digits) if digits else 1
+            digits = ''
+            if char in 'bo' and x + count > width:
+                raise ValueError(f'Row {y} is wider than {width}')
+            if char == 'o' and y >= height:
+                raise ValueError(f'More than {height} rows')
+
+            if char == 'b':
+                x += count
+            elif char == 'o':
+                for _ in range(count):
+                    grid.set(y, x, ALIVE)
+                    x += 1
+            elif char == '$':
+                y += count
+                x = 0
+            elif char == '!':
+                return grid
+            else:
+                raise ValueError(f'Unexpected RLE tag: {char!r}')
+
+    if grid is None:
+        raise ValueError('Missing RLE header')
+
+    return grid
+
+
+# Example 29
+grid = Grid(5, 9)
+grid.set(0, 3, ALIVE)
+grid.set(1, 4, ALIVE)
+grid.set(2, 2, ALIVE)
+grid.set(2, 3, ALIVE)
+grid.set(2, 4, ALIVE)
+
+output = io.StringIO()
+write_rle(grid, output)
+print(output.getvalue())
+assert output.getvalue().splitlines()[1] == '3bo$4bo$2b3o!'
+
+for board in (random_grid(20, 30), random_grid(40, 200, PackedGrid)):
+    with open('pattern.rle', 'w') as f:
+        write_rle(board, f)
+    with open('pattern.rle') as f:
+        loaded = read_rle(f, type(board))
+    assert str(loaded) == str(board)
+
+for lines in (['x = 3, y = 2', 'bo$4o!'],
+              ['x = 3, y = 2', 'o$o$o!'],
+              ['bo$2o!'],
+              ['x = 3', 'o!'],
+              []):
+    try:
+        read_rle(lines)
+    except ValueError:
+        pass  # Expected
+    else:
+        assert False
+
+
+# Example 30
+from collections import deque
+
+class ZobristHasher:
+    def __init__(self, height, width):
+        self.keys = []
+        for _ in range(height):
+            row = [random.getrandbits(64) for _ in range(width)]
+            self.keys.append(row)
+
+    def hash_grid(self, grid):
+        digest = 0
+        for y in range(grid.height):
+            for x in range(grid.width):
+                if grid.get(y, x) == ALIVE:
+                    digest ^= self.keys[y][x]
+        return digest
+
+    def update(self, digest, changed):
+        for y, x in changed:
+            digest ^= self.keys[y][x]  # Every change is a flip
+        return digest
+
+class CycleDetector:
+    def __init__(self, history=64):
+        self.history = history
+        self.order = deque()
+        self.seen = {}
+
+    def observe(self, generation, digest):
+        previous = self.seen.get(digest)
+        if previous is not None:
+            return generation - previous  # The period
+
+        self.order.append(digest)
+        self.seen[digest] = generation
+        if len(self.order) > self.history:
+            del self.seen[self.order.popleft()]
+        return None
+
+
+# Example 31
+def simulate_until_cycle(grid, generations, history=64):
+    hasher = ZobristHasher(grid.height, grid.width)
+    detector = CycleDetector(history)
+    digest = hasher.hash_grid(grid)
+    changed = {(y, x) for y in range(grid.height)
+               for x in range(grid.width)}
+
+    for generation in range(generations):
+        period = detector.observe(generation, digest)
+        if period is not None:
+            # Fast-forward to the same phase of the cycle
+            remaining = (generations - generation) % period
+            for _ in range(remaining):
+                changed, _ = simulate_incremental(grid, changed)
+            return generation, period
+
+        changed, _ = simulate_incremental(grid, changed)
+        digest = hasher.update(digest, changed)
+
+    return generations, None
+
+
+# Example 32
+grid = Grid(10, 10)
+grid.set(1, 1, ALIVE)  # Blinker
+grid.set(1, 2, ALIVE)
+grid.set(1, 3, ALIVE)
+grid.set(6, 6, ALIVE)  # Block
+grid.set(6, 7, ALIVE)
+grid.set(7, 6, ALIVE)
+grid.set(7, 7, ALIVE)
+expected = simulate(grid)
+
+stopped, period = simulate_until_cycle(grid, 1_000_001)
+print(f'Period {period} cycle found at generation {stopped}')
+assert str(grid) == str(expected)
+
+grid = random_grid(16, 16)
+expected = grid
+for _ in range(1000):
+    expected = simulate(expected)
+
+stopped, period = simulate_until_cycle(grid, 1000)
+print(f'Period {period} cycle found at generation {stopped}')
+assert str(grid) == str(expected)
@@ -209,3 +209,145 @@ with contextlib.redirect_stderr(fake_stderr):
     thread.join()
 
 print(fake_stderr.getvalue())
+
+
+# Example 6
+# Restore the working version of this function
+def game_logic(state, neighbors):
+    if state == ALIVE:
+        if neighbors < 2:
+            return EMPTY     # Die: Too few
+        elif neighbors > 3:
+            return EMPTY     # Die: Too many
+    else:
+        if neighbors == 3:
+            return ALIVE     # Regenerate
+    return state
+
+class FrozenGrid:
+    def __init__(self, height, width, rows):
+        self.height = height
+        self.width = width
+        self.rows = tuple(tuple(row) for row in rows)
+
+    def get(self, y, x):
+        return self.rows[y % self.height][x % self.width]
+
+    def __str__(self):
+        return ''.join(''.join(row) + '\n' for row in self.rows)
+
+class StripedGrid(Grid):
+    def __init__(self, height, width, stripes=8):
+        super().__init__(height, width)
+        self.locks = [Lock() for _ in range(stripes)]
+
+    def lock_for(self, y):
+        return self.locks[(y % self.height) % len(self.locks)]
+
+    def get(self, y, x):
+        with self.lock_for(y):
+            return super().get(y, x)
+
+    def set(self, y, x, state):
+        with self.lock_for(y):
+            return super().set(y, x, state)
+
+    def snapshot(self):
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            return FrozenGrid(self.height, self.width, self.rows)
+        finally:
+            for lock in self.locks:
+                lock.release()
+
+    def __str__(self):
+        return str(self.snapshot())
+
+
+# Example 7
+def simulate_snapshot(grid):
+    previous = grid.snapshot()  # Read without locking
+    next_grid = StripedGrid(grid.height, grid.width)
+
+    threads = []
+    for y in range(grid.height):
+        for x in range(grid.width):
+            args = (y, x, previous.get, next_grid.set)
+            thread = Thread(target=step_cell, args=args)
+            thread.start()  # Fan out
+            threads.append(thread)
+
+    for thread in threads:
+        thread.join()       # Fan in
+
+    return next_grid
+
+
+# Example 8
+grid = LockingGrid(5, 9)
+striped = StripedGrid(5, 9)
+for board in (grid, striped):
+    board.set(0, 3, ALIVE)
+    board.set(1, 4, ALIVE)
+    board.set(2, 2, ALIVE)
+    board.set(2, 3, ALIVE)
+    board.set(2, 4, ALIVE)
+
+columns = ColumnPrinter()
+for i in range(5):
+    assert str(striped) == str(grid)
+    columns.append(str(striped))
+    grid = simulate_threaded(grid)
+    striped = simulate_snapshot(striped)
+
+print(columns)
+
+
+# Example 9
+def compile_rule(rulestring):
+    birth, _, survival = rulestring.upper().partition('/')
+    if not (birth.startswith('B') and survival.startswith('S')):
+        raise ValueError(f'Invalid rulestring: {rulestring!r}')
+
+    digits = birth[1:] + survival[1:]
+    if not all(digit in '012345678' for digit in digits):
+        raise ValueError(f'Invalid neighbor count in {rulestring!r}')
+
+    table = {}
+    for neighbors in range(9):
+        born = str(neighbors) in birth[1:]
+        survives = str(neighbors) in survival[1:]
+        table[EMPTY, neighbors] = ALIVE if born else EMPTY
+        table[ALIVE, neighbors] = ALIVE if survives else EMPTY
+    return table
+
+def make_game_logic(table):
+    def game_logic(state, neighbors):
+        return table[state, neighbors]
+    return game_logic
+
+for rulestring in ('B9/S23', 'Bx/S23', 'B3/S23/C4'):
+    try:
+        compile_rule(rulestring)
+    except ValueError:
+        pass  # Expected
+    else:
+        assert False
+
+def six_neighbors(grid_type):
+    grid = grid_type(5, 5)
+    for x in (1, 2, 3):
+        grid.set(1, x, ALIVE)
+        grid.set(3, x, ALIVE)
+    return grid
+
+game_logic = make_game_logic(compile_rule('B36/S23'))
+threaded = simulate_threaded(six_neighbors(LockingGrid))
+striped = simulate_snapshot(six_neighbors(StripedGrid))
+assert str(threaded) == str(striped)
+assert striped.get(2, 2) == ALIVE    # Born with six neighbors
+
+game_logic = make_game_logic(compile_rule('B3/S23'))
+striped = simulate_snapshot(six_neighbors(StripedGrid))
+assert striped.get(2, 2) == EMPTY
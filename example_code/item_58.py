@@ -411,3 +411,174 @@ except SimulationError:
     pass  # Expected
 else:
     assert False
+
+
+# Example 12
+# Restore the working version of this function
+def count_neighbors(y, x, get):
+    n_ = get(y - 1, x + 0)  # North
+    ne = get(y - 1, x + 1)  # Northeast
+    e_ = get(y + 0, x + 1)  # East
+    se = get(y + 1, x + 1)  # Southeast
+    s_ = get(y + 1, x + 0)  # South
+    sw = get(y + 1, x - 1)  # Southwest
+    w_ = get(y + 0, x - 1)  # West
+    nw = get(y - 1, x - 1)  # Northwest
+    neighbor_states = [n_, ne, e_, se, s_, sw, w_, nw]
+    count = 0
+    for state in neighbor_states:
+        if state == ALIVE:
+            count += 1
+    return count
+
+def game_logic_batch_thread(batch):
+    results = []
+    for y, x, state, neighbors in batch:
+        try:
+            next_state = game_logic(state, neighbors)
+        except Exception as e:
+            next_state = e
+        results.append((y, x, next_state))
+    return results
+
+
+# Example 13
+def simulate_batched_pipeline(
+        grid, in_queue, out_queue, batch_size=None):
+    if batch_size is None:
+        batch_size = grid.width         # One row per item
+
+    batch = []
+    for y in range(grid.height):
+        for x in range(grid.width):
+            state = grid.get(y, x)
+            neighbors = count_neighbors(y, x, grid.get)
+            batch.append((y, x, state, neighbors))
+            if len(batch) == batch_size:
+                in_queue.put(batch)     # Fan out
+                batch = []
+
+    if batch:
+        in_queue.put(batch)
+
+    in_queue.join()
+    out_queue.close()
+
+    next_grid = Grid(grid.height, grid.width)
+    for results in out_queue:           # Fan in
+        for y, x, next_state in results:
+            if isinstance(next_state, Exception):
+                raise SimulationError(y, x) from next_state
+            next_grid.set(y, x, next_state)
+
+    return next_grid
+
+
+# Example 14
+in_queue = ClosableQueue()
+out_queue = ClosableQueue()
+
+threads = []
+for _ in range(5):
+    thread = StoppableWorker(
+        game_logic_batch_thread, in_queue, out_queue)
+    thread.start()
+    threads.append(thread)
+
+grid = Grid(5, 9)
+grid.set(0, 3, ALIVE)
+grid.set(1, 4, ALIVE)
+grid.set(2, 2, ALIVE)
+grid.set(2, 3, ALIVE)
+grid.set(2, 4, ALIVE)
+
+columns = ColumnPrinter()
+for i in range(5):
+    columns.append(str(grid))
+    by_cell = simulate_batched_pipeline(
+        grid, in_queue, out_queue, batch_size=1)
+    by_tile = simulate_batched_pipeline(
+        grid, in_queue, out_queue, batch_size=16)
+    grid = simulate_batched_pipeline(grid, in_queue, out_queue)
+    assert str(by_cell) == str(grid)
+    assert str(by_tile) == str(grid)
+
+print(columns)
+
+for thread in threads:
+    in_queue.close()
+for thread in threads:
+    thread.join()
+
+
+# Example 15
+# Make sure exception propagation works as expected
+def game_logic(state, neighbors):
+    raise OSError('Problem with I/O in game_logic')
+
+in_queue = ClosableQueue()
+out_queue = ClosableQueue()
+thread = StoppableWorker(
+    game_logic_batch_thread, in_queue, out_queue, daemon=True)
+thread.start()
+
+try:
+    simulate_batched_pipeline(grid, in_queue, out_queue)
+except SimulationError:
+    pass  # Expected
+else:
+    assert False
+
+
+# Example 16
+def compile_rule(rulestring):
+    birth, _, survival = rulestring.upper().partition('/')
+    if not (birth.startswith('B') and survival.startswith('S')):
+        raise ValueError(f'Invalid rulestring: {rulestring!r}')
+
+    digits = birth[1:] + survival[1:]
+    if not all(digit in '012345678' for digit in digits):
+        raise ValueError(f'Invalid neighbor count in {rulestring!r}')
+
+    table = {}
+    for neighbors in range(9):
+        born = str(neighbors) in birth[1:]
+        survives = str(neighbors) in survival[1:]
+        table[EMPTY, neighbors] = ALIVE if born else EMPTY
+        table[ALIVE, neighbors] = ALIVE if survives else EMPTY
+    return table
+
+def make_game_logic(table):
+    def game_logic(state, neighbors):
+        return table[state, neighbors]
+    return game_logic
+
+for rulestring in ('B9/S23', 'Bx/S23', 'B3/S23/C4'):
+    try:
+        compile_rule(rulestring)
+    except ValueError:
+        pass  # Expected
+    else:
+        assert False
+
+in_queue = ClosableQueue()
+out_queue = ClosableQueue()
+thread = StoppableWorker(
+    game_logic_batch_thread, in_queue, out_queue)
+thread.start()
+
+grid = Grid(5, 5)
+for x in (1, 2, 3):
+    grid.set(1, x, ALIVE)
+    grid.set(3, x, ALIVE)
+
+game_logic = make_game_logic(compile_rule('B36/S23'))
+highlife = simulate_batched_pipeline(grid, in_queue, out_queue)
+assert highlife.get(2, 2) == ALIVE   # Born with six neighbors
+
+game_logic = make_game_logic(compile_rule('B3/S23'))
+conway = simulate_batched_pipeline(grid, in_queue, out_queue)
+assert conway.get(2, 2) == EMPTY
+
+in_queue.close()
+thread.join()
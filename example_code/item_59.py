@@ -205,3 +205,49 @@ except:
     logging.exception('Expected')
 else:
     assert False
+
+
+# Example 5
+def compile_rule(rulestring):
+    birth, _, survival = rulestring.upper().partition('/')
+    if not (birth.startswith('B') and survival.startswith('S')):
+        raise ValueError(f'Invalid rulestring: {rulestring!r}')
+
+    digits = birth[1:] + survival[1:]
+    if not all(digit in '012345678' for digit in digits):
+        raise ValueError(f'Invalid neighbor count in {rulestring!r}')
+
+    table = {}
+    for neighbors in range(9):
+        born = str(neighbors) in birth[1:]
+        survives = str(neighbors) in survival[1:]
+        table[EMPTY, neighbors] = ALIVE if born else EMPTY
+        table[ALIVE, neighbors] = ALIVE if survives else EMPTY
+    return table
+
+def make_game_logic(table):
+    def game_logic(state, neighbors):
+        return table[state, neighbors]
+    return game_logic
+
+for rulestring in ('B9/S23', 'Bx/S23', 'B3/S23/C4'):
+    try:
+        compile_rule(rulestring)
+    except ValueError:
+        pass  # Expected
+    else:
+        assert False
+
+grid = LockingGrid(5, 5)
+for x in (1, 2, 3):
+    grid.set(1, x, ALIVE)
+    grid.set(3, x, ALIVE)
+
+with ThreadPoolExecutor(max_workers=10) as pool:
+    game_logic = make_game_logic(compile_rule('B36/S23'))
+    highlife = simulate_pool(pool, grid)
+    assert highlife.get(2, 2) == ALIVE   # Born with six neighbors
+
+    game_logic = make_game_logic(compile_rule('B3/S23'))
+    conway = simulate_pool(pool, grid)
+    assert conway.get(2, 2) == EMPTY
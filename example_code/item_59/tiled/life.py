@@ -0,0 +1,244 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import os
+from multiprocessing import resource_tracker, shared_memory
+
+ALIVE = '*'
+EMPTY = '-'
+
+class Grid:
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.rows = []
+        for _ in range(self.height):
+            self.rows.append([EMPTY] * self.width)
+
+    def get(self, y, x):
+        return self.rows[y % self.height][x % self.width]
+
+    def set(self, y, x, state):
+        self.rows[y % self.height][x % self.width] = state
+
+    def __str__(self):
+        output = ''
+        for row in self.rows:
+            for cell in row:
+                output += cell
+            output += '\n'
+        return output
+
+def count_neighbors(y, x, get):
+    n_ = get(y - 1, x + 0)  # North
+    ne = get(y - 1, x + 1)  # Northeast
+    e_ = get(y + 0, x + 1)  # East
+    se = get(y + 1, x + 1)  # Southeast
+    s_ = get(y + 1, x + 0)  # South
+    sw = get(y + 1, x - 1)  # Southwest
+    w_ = get(y + 0, x - 1)  # West
+    nw = get(y - 1, x - 1)  # Northwest
+    neighbor_states = [n_, ne, e_, se, s_, sw, w_, nw]
+    count = 0
+    for state in neighbor_states:
+        if state == ALIVE:
+            count += 1
+    return count
+
+def game_logic(state, neighbors):
+    if state == ALIVE:
+        if neighbors < 2:
+            return EMPTY     # Die: Too few
+        elif neighbors > 3:
+            return EMPTY     # Die: Too many
+    else:
+        if neighbors == 3:
+            return ALIVE     # Regenerate
+    return state
+
+def compile_rule(rulestring):
+    birth, _, survival = rulestring.upper().partition('/')
+    if not (birth.startswith('B') and survival.startswith('S')):
+        raise ValueError(f'Invalid rulestring: {rulestring!r}')
+
+    digits = birth[1:] + survival[1:]
+    if not all(digit in '012345678' for digit in digits):
+        raise ValueError(f'Invalid neighbor count in {rulestring!r}')
+
+    table = {}
+    for neighbors in range(9):
+        born = str(neighbors) in birth[1:]
+        survives = str(neighbors) in survival[1:]
+        table[EMPTY, neighbors] = ALIVE if born else EMPTY
+        table[ALIVE, neighbors] = ALIVE if survives else EMPTY
+    return table
+
+CONWAY = compile_rule('B3/S23')
+
+def step_cell(y, x, get, set):
+    state = get(y, x)
+    neighbors = count_neighbors(y, x, get)
+    next_state = game_logic(state, neighbors)
+    set(y, x, next_state)
+
+def simulate(grid):
+    next_grid = Grid(grid.height, grid.width)
+    for y in range(grid.height):
+        for x in range(grid.width):
+            step_cell(y, x, grid.get, next_grid.set)
+    return next_grid
+
+# A band's shared memory holds two generations back to back. Each
+# generation is (height + 2) rows of one byte per cell: a halo row
+# copied from the band above, the band's own rows, and a halo row
+# copied from the band below.
+class Band:
+    def __init__(self, start, stop, width):
+        self.start = start
+        self.height = stop - start
+        self.width = width
+        self.size = (self.height + 2) * width
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=2 * self.size)
+
+    def offset(self, generation, y):
+        return generation * self.size + (y + 1) * self.width
+
+    def read_row(self, generation, y):
+        offset = self.offset(generation, y)
+        return bytes(self.shm.buf[offset:offset + self.width])
+
+    def write_row(self, generation, y, data):
+        offset = self.offset(generation, y)
+        self.shm.buf[offset:offset + self.width] = data
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+# Worker processes keep the segments of the grid they are stepping
+# open between generations, keyed by the grid that owns them
+ATTACHED = {}
+
+def attach(grid_id, name):
+    segments = ATTACHED.get(grid_id)
+    if segments is None:
+        for stale in ATTACHED.values():  # Grid was closed
+            for shm in stale.values():
+                shm.close()
+        ATTACHED.clear()
+        segments = ATTACHED[grid_id] = {}
+
+    shm = segments.get(name)
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=name)
+        segments[name] = shm
+    return shm
+
+def step_band(grid_id, name, height, width, source, rule=CONWAY):
+    buf = attach(grid_id, name).buf
+    size = (height + 2) * width
+    read = source * size
+    write = (1 - source) * size
+    alive_byte = ord(ALIVE)
+
+    rows = []
+    for y in range(height + 2):
+        start = read + y * width
+        row = buf[start:start + width]
+        rows.append([1 if cell == alive_byte else 0 for cell in row])
+
+    for y in range(1, height + 1):
+        above, row, below = rows[y - 1], rows[y], rows[y + 1]
+        columns = [a + b + c for a, b, c in zip(above, row, below)]
+        next_row = bytearray(width)
+        for x in range(width):
+            neighbors = (columns[x - 1] + columns[x] +
+                         columns[(x + 1) % width] - row[x])
+            state = ALIVE if row[x] else EMPTY
+            next_row[x] = ord(rule[state, neighbors])
+        start = write + y * width
+        buf[start:start + width] = next_row
+
+GRID_IDS = itertools.count()
+
+class TiledGrid:
+    def __init__(self, grid, band_count, rule=CONWAY):
+        # Pool workers must inherit the same tracker, otherwise
+        # their own trackers would unlink segments when they exit.
+        # Windows frees shared memory without a tracker.
+        if os.name == 'posix':
+            resource_tracker.ensure_running()
+        self.grid_id = next(GRID_IDS)
+        self.height = grid.height
+        self.width = grid.width
+        self.rule = rule
+        self.current = 0
+
+        band_count = max(1, min(band_count, grid.height))
+        bounds = [grid.height * i // band_count
+                  for i in range(band_count + 1)]
+        self.bands = []
+        for start, stop in zip(bounds, bounds[1:]):
+            band = Band(start, stop, grid.width)
+            for y in range(band.height):
+                row = ''.join(grid.get(start + y, x)
+                              for x in range(grid.width))
+                band.write_row(0, y, row.encode())
+            self.bands.append(band)
+
+        self.exchange_halos()
+
+    def exchange_halos(self):
+        generation = self.current
+        for i, band in enumerate(self.bands):
+            above = self.bands[i - 1]
+            below = self.bands[(i + 1) % len(self.bands)]
+            top = above.read_row(generation, above.height - 1)
+            bottom = below.read_row(generation, 0)
+            band.write_row(generation, -1, top)
+            band.write_row(generation, band.height, bottom)
+
+    def step(self, pool):
+        futures = []
+        for band in self.bands:
+            future = pool.submit(
+                step_band, self.grid_id, band.shm.name, band.height,
+                self.width, self.current, self.rule)     # Fan out
+            futures.append(future)
+
+        for future in futures:
+            future.result()                              # Fan in
+
+        self.current = 1 - self.current
+        self.exchange_halos()
+
+    def to_grid(self):
+        grid = Grid(self.height, self.width)
+        for band in self.bands:
+            for y in range(band.height):
+                row = band.read_row(self.current, y).decode()
+                grid.rows[band.start + y] = list(row)
+        return grid
+
+    def close(self):
+        for band in self.bands:
+            band.close()
+
+def simulate_tiled(pool, tiled):
+    tiled.step(pool)
+    return tiled
@@ -0,0 +1,69 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import life
+from concurrent.futures import ProcessPoolExecutor
+import os
+import random
+import time
+
+def random_grid(height, width, density=0.3):
+    grid = life.Grid(height, width)
+    for y in range(height):
+        for x in range(width):
+            if random.random() < density:
+                grid.set(y, x, life.ALIVE)
+    return grid
+
+def attached_grids(_):
+    return list(life.ATTACHED)
+
+def main():
+    random.seed(1234)
+
+    grid = random_grid(40, 50)
+    expected = grid
+    for _ in range(5):
+        expected = life.simulate(expected)
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        for _ in range(3):          # Reuse the pool across grids
+            tiled = life.TiledGrid(grid, 4)
+            try:
+                for _ in range(5):
+                    life.simulate_tiled(pool, tiled)
+                assert str(tiled.to_grid()) == str(expected)
+            finally:
+                tiled.close()
+            for grid_ids in pool.map(attached_grids, range(4)):
+                assert grid_ids in ([], [tiled.grid_id])
+
+    grid = random_grid(400, 400)
+    for workers in range(1, os.cpu_count() + 1):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tiled = life.TiledGrid(grid, workers)
+            try:
+                start = time.time()
+                for _ in range(5):
+                    life.simulate_tiled(pool, tiled)
+                end = time.time()
+            finally:
+                tiled.close()
+        delta = end - start
+        print(f'{workers} workers took {delta:.3f} seconds')
+
+if __name__ == '__main__':
+    main()
@@ -245,3 +245,141 @@ for i in range(5):
 print(columns)
 
 logging.getLogger().setLevel(logging.DEBUG)
+
+
+# Example 7
+def iter_chunks(grid, chunk_size):
+    chunk = []
+    for y in range(grid.height):
+        for x in range(grid.width):
+            chunk.append((y, x))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+async def step_chunk(chunk, get, set, semaphore):
+    try:
+        for y, x in chunk:
+            await step_cell(y, x, get, set)
+    finally:
+        semaphore.release()
+
+async def simulate_bounded(grid, chunk_size=64, max_chunks=8):
+    next_grid = Grid(grid.height, grid.width)
+    semaphore = asyncio.Semaphore(max_chunks)
+
+    pending = set()
+    for chunk in iter_chunks(grid, chunk_size):
+        await semaphore.acquire()
+        for task in [task for task in pending if task.done()]:
+            pending.remove(task)
+            task.result()  # Surface errors right away
+        task = asyncio.create_task(
+            step_chunk(chunk, grid.get, next_grid.set, semaphore))
+        pending.add(task)                           # Fan out
+
+    await asyncio.gather(*pending)                  # Fan in
+
+    return next_grid
+
+
+# Example 8
+logging.getLogger().setLevel(logging.ERROR)
+
+grid = Grid(5, 9)
+grid.set(0, 3, ALIVE)
+grid.set(1, 4, ALIVE)
+grid.set(2, 2, ALIVE)
+grid.set(2, 3, ALIVE)
+grid.set(2, 4, ALIVE)
+
+columns = ColumnPrinter()
+for i in range(5):
+    columns.append(str(grid))
+    expected = asyncio.run(simulate(grid))
+    grid = asyncio.run(simulate_bounded(grid, chunk_size=4))
+    assert str(grid) == str(expected)
+
+print(columns)
+
+logging.getLogger().setLevel(logging.DEBUG)
+
+
+# Example 9
+import random
+import tracemalloc
+
+def measure_peak(func, grid):
+    tracemalloc.start()
+    asyncio.run(func(grid))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+logging.getLogger().setLevel(logging.ERROR)
+
+for size in (50, 100, 200):
+    grid = Grid(size, size)
+    for y in range(size):
+        for x in range(size):
+            if random.random() < 0.3:
+                grid.set(y, x, ALIVE)
+    gathered = measure_peak(simulate, grid)
+    bounded = measure_peak(simulate_bounded, grid)
+    print(f'{size}x{size}: simulate peak {gathered:,} bytes, '
+          f'simulate_bounded peak {bounded:,} bytes')
+
+logging.getLogger().setLevel(logging.DEBUG)
+
+
+# Example 10
+def compile_rule(rulestring):
+    birth, _, survival = rulestring.upper().partition('/')
+    if not (birth.startswith('B') and survival.startswith('S')):
+        raise ValueError(f'Invalid rulestring: {rulestring!r}')
+
+    digits = birth[1:] + survival[1:]
+    if not all(digit in '012345678' for digit in digits):
+        raise ValueError(f'Invalid neighbor count in {rulestring!r}')
+
+    table = {}
+    for neighbors in range(9):
+        born = str(neighbors) in birth[1:]
+        survives = str(neighbors) in survival[1:]
+        table[EMPTY, neighbors] = ALIVE if born else EMPTY
+        table[ALIVE, neighbors] = ALIVE if survives else EMPTY
+    return table
+
+def make_game_logic(table):
+    async def game_logic(state, neighbors):
+        return table[state, neighbors]
+    return game_logic
+
+for rulestring in ('B9/S23', 'Bx/S23', 'B3/S23/C4'):
+    try:
+        compile_rule(rulestring)
+    except ValueError:
+        pass  # Expected
+    else:
+        assert False
+
+logging.getLogger().setLevel(logging.ERROR)
+
+grid = Grid(5, 5)
+for x in (1, 2, 3):
+    grid.set(1, x, ALIVE)
+    grid.set(3, x, ALIVE)
+
+game_logic = make_game_logic(compile_rule('B36/S23'))
+gathered = asyncio.run(simulate(grid))
+bounded = asyncio.run(simulate_bounded(grid, chunk_size=4))
+assert str(gathered) == str(bounded)
+assert bounded.get(2, 2) == ALIVE    # Born with six neighbors
+
+game_logic = make_game_logic(compile_rule('B3/S23'))
+bounded = asyncio.run(simulate_bounded(grid, chunk_size=4))
+assert bounded.get(2, 2) == EMPTY
+
+logging.getLogger().setLevel(logging.DEBUG)
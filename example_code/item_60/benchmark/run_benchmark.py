@@ -0,0 +1,82 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import strategies
+from concurrent.futures import ProcessPoolExecutor
+import random
+import resource
+import sys
+import time
+
+SIZES = [(8, 8), (16, 16), (32, 32), (64, 64)]
+DENSITIES = [0.1, 0.3]
+GENERATIONS = [1, 10]
+
+def random_grid(height, width, density, seed):
+    rng = random.Random(seed)
+    grid = strategies.Grid(height, width)
+    for y in range(height):
+        for x in range(width):
+            if rng.random() < density:
+                grid.set(y, x, strategies.ALIVE)
+    return grid
+
+def peak_rss_bytes():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak      # Already in bytes
+    return peak * 1024   # Kilobytes everywhere else
+
+def measure(name, height, width, density, generations, seed):
+    grid = random_grid(height, width, density, seed)
+    run = strategies.STRATEGIES[name]
+    start = time.perf_counter()
+    result = run(grid, generations)
+    delta = time.perf_counter() - start
+    return str(result), delta, peak_rss_bytes()
+
+def measure_isolated(*args):
+    # A fresh process per measurement keeps peak RSS independent
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(measure, *args).result()
+
+def main():
+    print(f'{"strategy":>10} {"size":>7} {"density":>7} '
+          f'{"gens":>4} {"cells/sec":>12} {"peak RSS":>12}')
+
+    for seed, (height, width) in enumerate(SIZES):
+        for density in DENSITIES:
+            for generations in GENERATIONS:
+                outputs = {}
+                for name in strategies.STRATEGIES:
+                    output, delta, peak = measure_isolated(
+                        name, height, width, density, generations, seed)
+                    outputs[name] = output
+                    rate = height * width * generations / delta
+                    print(f'{name:>10} {height:>3}x{width:<3} '
+                          f'{density:>7.1f} {generations:>4} '
+                          f'{rate:>12,.0f} {peak:>12,}')
+
+                expected = outputs['serial']
+                for name, output in outputs.items():
+                    if output != expected:
+                        raise RuntimeError(
+                            f'{name} disagrees with serial for '
+                            f'{height}x{width}, density {density}, '
+                            f'{generations} generations')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from threading import Lock, Thread
+
+ALIVE = '*'
+EMPTY = '-'
+
+class SimulationError(Exception):
+    pass
+
+class Grid:
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.rows = []
+        for _ in range(self.height):
+            self.rows.append([EMPTY] * self.width)
+
+    def get(self, y, x):
+        return self.rows[y % self.height][x % self.width]
+
+    def set(self, y, x, state):
+        self.rows[y % self.height][x % self.width] = state
+
+    def __str__(self):
+        output = ''
+        for row in self.rows:
+            for cell in row:
+                output += cell
+            output += '\n'
+        return output
+
+class LockingGrid(Grid):
+    def __init__(self, height, width):
+        super().__init__(height, width)
+        self.lock = Lock()
+
+    def __str__(self):
+        with self.lock:
+            return super().__str__()
+
+    def get(self, y, x):
+        with self.lock:
+            return super().get(y, x)
+
+    def set(self, y, x, state):
+        with self.lock:
+            return super().set(y, x, state)
+
+def count_neighbors(y, x, get):
+    n_ = get(y - 1, x + 0)  # North
+    ne = get(y - 1, x + 1)  # Northeast
+    e_ = get(y + 0, x + 1)  # East
+    se = get(y + 1, x + 1)  # Southeast
+    s_ = get(y + 1, x + 0)  # South
+    sw = get(y + 1, x - 1)  # Southwest
+    w_ = get(y + 0, x - 1)  # West
+    nw = get(y - 1, x - 1)  # Northwest
+    neighbor_states = [n_, ne, e_, se, s_, sw, w_, nw]
+    count = 0
+    for state in neighbor_states:
+        if state == ALIVE:
+            count += 1
+    return count
+
+def game_logic(state, neighbors):
+    if state == ALIVE:
+        if neighbors < 2:
+            return EMPTY     # Die: Too few
+        elif neighbors > 3:
+            return EMPTY     # Die: Too many
+    else:
+        if neighbors == 3:
+            return ALIVE     # Regenerate
+    return state
+
+def step_cell(y, x, get, set):
+    state = get(y, x)
+    neighbors = count_neighbors(y, x, get)
+    next_state = game_logic(state, neighbors)
+    set(y, x, next_state)
+
+# Item 56: Serial
+def simulate(grid):
+    next_grid = Grid(grid.height, grid.width)
+    for y in range(grid.height):
+        for x in range(grid.width):
+            step_cell(y, x, grid.get, next_grid.set)
+    return next_grid
+
+def run_serial(grid, generations):
+    for _ in range(generations):
+        grid = simulate(grid)
+    return grid
+
+# Item 57: A thread per cell
+def simulate_threaded(grid):
+    next_grid = LockingGrid(grid.height, grid.width)
+
+    threads = []
+    for y in range(grid.height):
+        for x in range(grid.width):
+            args = (y, x, grid.get, next_grid.set)
+            thread = Thread(target=step_cell, args=args)
+            thread.start()  # Fan out
+            threads.append(thread)
+
+    for thread in threads:
+        thread.join()       # Fan in
+
+    return next_grid
+
+def run_threaded(grid, generations):
+    for _ in range(generations):
+        grid = simulate_threaded(grid)
+    return grid
+
+# Item 58: Queue pipeline
+class ClosableQueue(Queue):
+    SENTINEL = object()
+
+    def close(self):
+        self.put(self.SENTINEL)
+
+    def __iter__(self):
+        while True:
+            item = self.get()
+            try:
+                if item is self.SENTINEL:
+                    return  # Cause the thread to exit
+                yield item
+            finally:
+                self.task_done()
+
+class StoppableWorker(Thread):
+    def __init__(self, func, in_queue, out_queue, **kwargs):
+        super().__init__(**kwargs)
+        self.func = func
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+
+    def run(self):
+        for item in self.in_queue:
+            result = self.func(item)
+            self.out_queue.put(result)
+
+def game_logic_thread(item):
+    y, x, state, neighbors = item
+    try:
+        next_state = game_logic(state, neighbors)
+    except Exception as e:
+        next_state = e
+    return (y, x, next_state)
+
+def simulate_pipeline(grid, in_queue, out_queue):
+    for y in range(grid.height):
+        for x in range(grid.width):
+            state = grid.get(y, x)
+            neighbors = count_neighbors(y, x, grid.get)
+            in_queue.put((y, x, state, neighbors))  # Fan out
+
+    in_queue.join()
+    out_queue.close()
+
+    next_grid = Grid(grid.height, grid.width)
+    for item in out_queue:                          # Fan in
+        y, x, next_state = item
+        if isinstance(next_state, Exception):
+            raise SimulationError(y, x) from next_state
+        next_grid.set(y, x, next_state)
+
+    return next_grid
+
+def run_pipeline(grid, generations):
+    in_queue = ClosableQueue()
+    out_queue = ClosableQueue()
+    threads = []
+    for _ in range(5):
+        thread = StoppableWorker(
+            game_logic_thread, in_queue, out_queue)
+        thread.start()
+        threads.append(thread)
+
+    try:
+        for _ in range(generations):
+            grid = simulate_pipeline(grid, in_queue, out_queue)
+    finally:
+        for thread in threads:
+            in_queue.close()
+        for thread in threads:
+            thread.join()
+
+    return grid
+
+# Item 59: ThreadPoolExecutor
+def simulate_pool(pool, grid):
+    next_grid = LockingGrid(grid.height, grid.width)
+
+    futures = []
+    for y in range(grid.height):
+        for x in range(grid.width):
+            args = (y, x, grid.get, next_grid.set)
+            future = pool.submit(step_cell, *args)  # Fan out
+            futures.append(future)
+
+    for future in futures:
+        future.result()                             # Fan in
+
+    return next_grid
+
+def run_pool(grid, generations):
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        for _ in range(generations):
+            grid = simulate_pool(pool, grid)
+    return grid
+
+# Item 60: asyncio
+async def game_logic_async(state, neighbors):
+    return game_logic(state, neighbors)
+
+async def step_cell_async(y, x, get, set):
+    state = get(y, x)
+    neighbors = count_neighbors(y, x, get)
+    next_state = await game_logic_async(state, neighbors)
+    set(y, x, next_state)
+
+async def simulate_async(grid):
+    next_grid = Grid(grid.height, grid.width)
+
+    tasks = []
+    for y in range(grid.height):
+        for x in range(grid.width):
+            task = step_cell_async(
+                y, x, grid.get, next_grid.set)      # Fan out
+            tasks.append(task)
+
+    await asyncio.gather(*tasks)                    # Fan in
+
+    return next_grid
+
+def run_asyncio(grid, generations):
+    for _ in range(generations):
+        grid = asyncio.run(simulate_async(grid))
+    return grid
+
+STRATEGIES = {
+    'serial': run_serial,
+    'threaded': run_threaded,
+    'pipeline': run_pipeline,
+    'pool': run_pool,
+    'asyncio': run_asyncio,
+}
@@ -14,6 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 def gcd(pair):
     a, b = pair
     low = min(a, b)
@@ -21,3 +26,20 @@ def gcd(pair):
         if a % i == 0 and b % i == 0:
             return i
     assert False, 'Not reachable'
+
+def euclid_gcd(pair):
+    a, b = pair
+    while b:
+        a, b = b, a % b
+    return a
+
+def gcd_many(pairs):
+    pairs = list(pairs)
+    if numpy is not None and pairs:
+        try:
+            array = numpy.array(pairs, dtype=numpy.int64)
+        except OverflowError:
+            pass  # Too big for int64, use Python integers
+        else:
+            return numpy.gcd(array[:, 0], array[:, 1]).tolist()
+    return [euclid_gcd(pair) for pair in pairs]
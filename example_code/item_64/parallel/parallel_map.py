@@ -0,0 +1,88 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
+import time
+
+def call_chunk(func, chunk):
+    return [func(item) for item in chunk]
+
+class ParallelMapper:
+    def __init__(self, max_workers=None, target_seconds=0.05,
+                 sample_size=8):
+        self.max_workers = max_workers or os.cpu_count()
+        self.target_seconds = target_seconds
+        self.sample_size = sample_size
+        self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.pool.shutdown()
+
+    def pick_chunksize(self, per_item, total=None):
+        if per_item > 0:
+            chunksize = int(self.target_seconds / per_item)
+        else:
+            chunksize = 1_000
+        if total is not None:
+            # Leave enough chunks to keep every worker busy
+            chunksize = min(chunksize, total // (self.max_workers * 4))
+        return max(1, chunksize)
+
+    def map(self, func, items):
+        total = len(items) if hasattr(items, '__len__') else None
+        iterator = iter(items)
+
+        # Time a few items locally; their results aren't wasted
+        sample_results = []
+        start = time.perf_counter()
+        elapsed = 0
+        for item in iterator:
+            sample_results.append(func(item))
+            elapsed = time.perf_counter() - start
+            if (len(sample_results) >= self.sample_size or
+                    elapsed >= self.target_seconds):
+                break
+
+        per_item = elapsed / max(1, len(sample_results))
+        yield from sample_results
+
+        if total is not None:
+            total -= len(sample_results)
+        chunksize = self.pick_chunksize(per_item, total)
+
+        pending = deque()
+        window = self.max_workers * 2
+        while True:
+            while len(pending) < window:
+                chunk = list(islice(iterator, chunksize))
+                if not chunk:
+                    break
+                future = self.pool.submit(call_chunk, func, chunk)
+                pending.append(future)
+
+            if not pending:
+                return
+
+            yield from pending.popleft().result()  # Keep input order
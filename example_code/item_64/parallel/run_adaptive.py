@@ -0,0 +1,56 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import my_module
+from concurrent.futures import ProcessPoolExecutor
+from parallel_map import ParallelMapper
+import time
+
+NUMBERS = [
+    (1963309, 2265973), (2030677, 3814172),
+    (1551645, 2229620), (2039045, 2020802),
+    (1823712, 1924928), (2293129, 1020491),
+    (1281238, 2273782), (3823812, 4237281),
+    (3812741, 4729139), (1292391, 2123811),
+]
+
+def main():
+    numbers = NUMBERS * 2_000
+    expected = [my_module.euclid_gcd(pair) for pair in numbers]
+
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(my_module.euclid_gcd, numbers))
+    end = time.time()
+    assert results == expected
+    print(f'pool.map took {end - start:.3f} seconds')
+
+    with ParallelMapper(max_workers=2) as mapper:
+        start = time.time()
+        results = list(mapper.map(my_module.euclid_gcd, numbers))
+        end = time.time()
+        assert results == expected
+        print(f'ParallelMapper took {end - start:.3f} seconds')
+
+        # The same warm pool serves the slow version too
+        start = time.time()
+        results = list(mapper.map(my_module.gcd, NUMBERS))
+        end = time.time()
+        assert results == expected[:len(NUMBERS)]
+        print(f'ParallelMapper with gcd took {end - start:.3f} seconds')
+
+if __name__ == '__main__':
+    main()
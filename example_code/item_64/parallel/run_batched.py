@@ -0,0 +1,64 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import my_module
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import time
+
+NUMBERS = [
+    (1963309, 2265973), (2030677, 3814172),
+    (1551645, 2229620), (2039045, 2020802),
+    (1823712, 1924928), (2293129, 1020491),
+    (1281238, 2273782), (3823812, 4237281),
+    (3812741, 4729139), (1292391, 2123811),
+]
+
+def split(items, count):
+    size = -(-len(items) // count)  # Round up
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def run_serial(numbers):
+    return my_module.gcd_many(numbers)
+
+def run_pool(pool, numbers):
+    results = []
+    for batch in pool.map(my_module.gcd_many, split(numbers, 2)):
+        results.extend(batch)
+    return results
+
+def main():
+    expected = list(map(my_module.gcd, NUMBERS))
+    assert my_module.gcd_many(NUMBERS) == expected
+    assert my_module.gcd_many([(2**70, 2**65 * 3)]) == [2**65]
+
+    numbers = NUMBERS * 100_000
+
+    start = time.time()
+    results = run_serial(numbers)
+    end = time.time()
+    assert results == expected * 100_000
+    print(f'Serial took {end - start:.3f} seconds')
+
+    for pool_type in (ThreadPoolExecutor, ProcessPoolExecutor):
+        with pool_type(max_workers=2) as pool:
+            start = time.time()
+            results = run_pool(pool, numbers)
+            end = time.time()
+        assert results == expected * 100_000
+        print(f'{pool_type.__name__} took {end - start:.3f} seconds')
+
+if __name__ == '__main__':
+    main()
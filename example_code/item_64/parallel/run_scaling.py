@@ -0,0 +1,114 @@
+#!/usr/bin/env PYTHONHASHSEED=1234 python3
+
+# Copyright 2014-2019 Brett Slatkin, Pearson Education Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import my_module
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import csv
+import json
+import os
+import statistics
+import sys
+import time
+
+NUMBERS = [
+    (1963309, 2265973), (2030677, 3814172),
+    (1551645, 2229620), (2039045, 2020802),
+    (1823712, 1924928), (2293129, 1020491),
+    (1281238, 2273782), (3823812, 4237281),
+    (3812741, 4729139), (1292391, 2123811),
+]
+
+FIELDS = [
+    'runner', 'workers', 'repeat', 'median_seconds',
+    'stdev_seconds', 'speedup', 'efficiency',
+]
+
+def run_serial(workers):
+    return list(map(my_module.gcd, NUMBERS))
+
+def run_threads(workers):
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(my_module.gcd, NUMBERS))
+
+def run_parallel(workers):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(my_module.gcd, NUMBERS))
+
+def time_runs(func, workers, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(workers)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def measure(max_workers, repeat):
+    serial = time_runs(run_serial, 1, repeat)
+    baseline = statistics.median(serial)
+    points = [('serial', 1, serial)]
+    for workers in range(1, max_workers + 1):
+        points.append(
+            ('threads', workers,
+             time_runs(run_threads, workers, repeat)))
+        points.append(
+            ('parallel', workers,
+             time_runs(run_parallel, workers, repeat)))
+
+    rows = []
+    for runner, workers, timings in points:
+        median = statistics.median(timings)
+        stdev = statistics.stdev(timings) if repeat > 1 else 0.0
+        speedup = baseline / median
+        rows.append({
+            'runner': runner,
+            'workers': workers,
+            'repeat': repeat,
+            'median_seconds': round(median, 6),
+            'stdev_seconds': round(stdev, 6),
+            'speedup': round(speedup, 3),
+            'efficiency': round(speedup / workers, 3),
+        })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Report speedup and efficiency of the gcd runners')
+    parser.add_argument('--max-workers', type=int,
+                        default=os.cpu_count())
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--format', choices=['csv', 'json'],
+                        default='csv')
+    parser.add_argument('--output', help='Defaults to stdout')
+    args = parser.parse_args()
+
+    rows = measure(args.max_workers, args.repeat)
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        if args.format == 'json':
+            json.dump(rows, output, indent=2)
+            output.write('\n')
+        else:
+            writer = csv.DictWriter(output, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+if __name__ == '__main__':
+    main()